@@ -17,22 +17,43 @@ Features:
 
 import sys
 import os
+import re
 import time
+import asyncio
+import hashlib
 import logging
+import logging.handlers
+import queue
+import random
 from pathlib import Path
 from typing import List
 
+import aiofiles
+
 # Import our custom modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from document_cleaner.text_splitter import TextSplitter, ChunkInfo
-from shared.api_client import FastAPIClient, APIClientError
+from shared.api_client import AsyncFastAPIClient, APIClientError, create_api_client
 from shared.config import Config
 
-# Setup logging
-logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+# Setup logging. Records are dropped onto a lock-free queue and formatted
+# on a background listener thread, so async workers never serialize on
+# handler I/O in the hot path.
+_log_queue = queue.SimpleQueue()
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
+_log_listener = logging.handlers.QueueListener(_log_queue, _stream_handler)
+_log_listener.start()
+logging.basicConfig(level=logging.INFO,
+                    handlers=[logging.handlers.QueueHandler(_log_queue)])
 logger = logging.getLogger(__name__)
 
+# Compiled once at import - collapses space runs and restores the
+# missing space after a sentence period inside API-cleaned chunks
+_MULTISPACE_RE = re.compile(r' +')
+_PERIOD_SPACE_RE = re.compile(r'\.([A-Z])')
+
 
 class DocumentCleaningError(Exception):
     """Custom exception for document cleaning errors."""
@@ -50,7 +71,10 @@ class DocumentCleaner:
     def __init__(self,
                  chunk_size: int = None,
                  chunk_overlap: int = None,
-                 max_retries: int = 3):
+                 max_retries: int = 3,
+                 max_concurrency: int = 8,
+                 batch_size: int = 16,
+                 use_async: bool = True):
         """
         Initialize the document cleaner.
 
@@ -58,14 +82,28 @@ class DocumentCleaner:
             chunk_size: Target chunk size in characters
             chunk_overlap: Overlap between chunks in characters
             max_retries: Maximum retry attempts for API calls
+            max_concurrency: Maximum number of in-flight API requests
+            batch_size: Number of chunks sent per API request
+            use_async: Use the asyncio pipeline; set False to fan out
+                with a thread pool over the synchronous client instead
         """
         # Initialize components
-        self.api_client = FastAPIClient()
         self.text_splitter = TextSplitter(
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap
         )
         self.max_retries = max_retries
+        self.max_concurrency = max_concurrency
+        self.batch_size = batch_size
+        self.use_async = use_async
+
+        # Maps content hash -> cleaned text so byte-identical chunks
+        # (repeated headers, footers, boilerplate) hit the API only once
+        self._cache = {}
+
+        # Output directories already created by this instance - avoids a
+        # stat/mkdir round-trip per saved document
+        self._ensured_dirs = set()
 
         logger.info("DocumentCleaner initialized")
 
@@ -83,30 +121,39 @@ class DocumentCleaner:
         Raises:
             DocumentCleaningError: If cleaning process fails
         """
+        return asyncio.run(self._clean_document_async(input_file, output_file))
+
+    async def _clean_document_async(self, input_file: str, output_file: str = None) -> dict:
+        """Async implementation of the cleaning pipeline."""
         start_time = time.time()
 
         try:
             logger.info(f"Starting document cleaning: {input_file}")
 
-            # Step 1: Load document
-            original_text = self._load_document(input_file)
+            # Step 1: Load document (non-blocking)
+            original_text = await self._load_document(input_file)
             logger.info(f"Loaded document: {len(original_text)} characters")
 
             # Step 2: Split into chunks
             chunks = self._split_text(original_text)
             logger.info(f"Split into {len(chunks)} chunks")
 
-            # Step 3: Clean chunks via API
-            cleaned_chunks = self._clean_chunks(chunks)
+            # Step 3: Clean chunks via API (concurrent dispatch)
+            if self.use_async:
+                cleaned_chunks = await self._clean_chunks(chunks)
+            else:
+                cleaned_chunks = await asyncio.to_thread(
+                    self._clean_chunks_threaded, chunks
+                )
 
             # Step 4: Aggregate results
             cleaned_text = self._aggregate_chunks(cleaned_chunks)
 
-            # Step 5: Save cleaned document
+            # Step 5: Save cleaned document (non-blocking)
             if output_file is None:
                 output_file = self._generate_output_filename(input_file)
 
-            self._save_document(cleaned_text, output_file)
+            await self._save_document(cleaned_text, output_file)
 
             # Calculate results
             processing_time = time.time() - start_time
@@ -134,7 +181,7 @@ class DocumentCleaner:
             logger.error(f"Document cleaning failed: {e}")
             raise DocumentCleaningError(f"Failed to clean document: {e}") from e
 
-    def _load_document(self, input_file: str) -> str:
+    async def _load_document(self, input_file: str) -> str:
         """
         Load document from file with basic error handling.
 
@@ -150,8 +197,12 @@ class DocumentCleaner:
             raise DocumentCleaningError(f"Input file not found: {input_file}")
 
         try:
-            with open(input_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Read the whole file as bytes in one go and decode once -
+            # faster than the buffered TextIOWrapper for multi-MB inputs.
+            # aiofiles keeps the read off the event loop.
+            async with aiofiles.open(input_path, 'rb') as f:
+                raw = await f.read()
+            content = raw.decode('utf-8')
 
             if not content.strip():
                 raise DocumentCleaningError("Input file is empty")
@@ -178,78 +229,201 @@ class DocumentCleaner:
         except Exception as e:
             raise DocumentCleaningError(f"Text splitting failed: {e}")
 
-    def _clean_chunks(self, chunks: List[ChunkInfo]) -> List[str]:
+    async def _clean_chunks(self, chunks: List[ChunkInfo]) -> List[str]:
         """
-        Clean each chunk by sending it to the FastAPI service.
+        Clean all chunks through a bounded producer/consumer pipeline.
+
+        A producer task groups chunks into batches of `batch_size` and
+        feeds them into a bounded asyncio.Queue; `max_concurrency` worker
+        tasks drain the queue and issue /clean-batch requests. The queue
+        bound caps how many batches are ever held in memory at once, and
+        cleaning starts as soon as the first batch is produced.
 
         Args:
-            chunks: List of chunks to clean
+            chunks: Chunks to clean (any iterable of ChunkInfo)
 
         Returns:
-            List of cleaned text strings
+            List of cleaned text strings (in original chunk order)
         """
-        cleaned_chunks = []
+        queue: asyncio.Queue = asyncio.Queue(
+            maxsize=max(1, 64 // self.batch_size)
+        )
+        results = {}
         successful = 0
         failed = 0
+        total = 0
+        batch_count = 0
+
+        async def producer():
+            nonlocal total, batch_count
+            index = 0
+            batch = []
+            for chunk in chunks:
+                total += 1
+                batch.append(chunk)
+                if len(batch) == self.batch_size:
+                    await queue.put((index, batch))
+                    index += 1
+                    batch = []
+            if batch:
+                await queue.put((index, batch))
+                index += 1
+            batch_count = index
+            # One sentinel per worker signals end of input
+            for _ in range(self.max_concurrency):
+                await queue.put(None)
+
+        async def worker(client):
+            nonlocal successful, failed
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                index, batch = item
+                try:
+                    results[index] = await self._clean_chunk_batch(client, batch)
+                    successful += len(batch)
+                except APIClientError as e:
+                    logger.warning(f"Failed to clean batch of {len(batch)} chunks: {e}")
+                    logger.warning("Using original text as fallback")
+
+                    # Use original text as fallback
+                    results[index] = [chunk.content for chunk in batch]
+                    failed += len(batch)
+
+        async with AsyncFastAPIClient() as client:
+            await asyncio.gather(
+                producer(),
+                *(worker(client) for _ in range(self.max_concurrency))
+            )
 
-        for i, chunk in enumerate(chunks, 1):
-            logger.info(f"Processing chunk {i}/{len(chunks)} ({chunk.char_count} chars)")
+        # Batch indices are dense 0..batch_count-1, so results can be
+        # reassembled by direct indexing - no sort needed
+        cleaned_chunks = []
+        for index in range(batch_count):
+            cleaned_chunks.extend(results[index])
 
-            try:
-                # Clean this chunk with retry
-                cleaned_text = self._clean_single_chunk(chunk)
-                cleaned_chunks.append(cleaned_text)
-                successful += 1
+        logger.info(f"Cleaning completed: {successful} successful, {failed} failed")
 
-            except APIClientError as e:
-                logger.warning(f"Failed to clean chunk {i}: {e}")
-                logger.warning("Using original text as fallback")
+        # Check if too many failures
+        if failed > total // 2:  # More than half failed
+            raise DocumentCleaningError(
+                f"Too many cleaning failures ({failed}/{total}). "
+                f"Check if FastAPI server is running."
+            )
 
-                # Use original text as fallback
-                cleaned_chunks.append(chunk.content)
-                failed += 1
+        return cleaned_chunks
 
-        logger.info(f"Cleaning completed: {successful} successful, {failed} failed")
+    def _clean_chunks_threaded(self, chunks: List[ChunkInfo]) -> List[str]:
+        """
+        Thread-pool fallback for cleaning chunks without asyncio.
+
+        The API calls are I/O-bound, so threads give the same fan-out as
+        the async pipeline while reusing the synchronous client. Results
+        are written into a preallocated list by index, preserving order.
+
+        Args:
+            chunks: List of chunks to clean
+
+        Returns:
+            List of cleaned text strings (in original chunk order)
+        """
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        client = create_api_client()
+        results: List[str] = [None] * len(chunks)
+        failed = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+            futures = {pool.submit(client.clean_text, chunk.content): i
+                       for i, chunk in enumerate(chunks)}
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except APIClientError as e:
+                    logger.warning(f"Failed to clean chunk {i + 1}: {e}")
+                    logger.warning("Using original text as fallback")
+                    results[i] = chunks[i].content
+                    failed += 1
+
+        logger.info(f"Cleaning completed: {len(chunks) - failed} successful, {failed} failed")
 
-        # Check if too many failures
         if failed > len(chunks) // 2:  # More than half failed
             raise DocumentCleaningError(
                 f"Too many cleaning failures ({failed}/{len(chunks)}). "
                 f"Check if FastAPI server is running."
             )
 
-        return cleaned_chunks
+        return results
+
+    async def _clean_chunk_batch(self,
+                                 client: AsyncFastAPIClient,
+                                 batch: List[ChunkInfo]) -> List[str]:
+        """
+        Clean a batch of chunks with retry logic.
+
+        Args:
+            client: Shared async API client
+            batch: Chunks to clean in one request
 
-    def _clean_single_chunk(self, chunk: ChunkInfo) -> str:
+        Returns:
+            List of cleaned texts for the batch
         """
-        Clean a single chunk with retry logic.
+        # Skip chunks whose cleaned text is already cached
+        keys = [hashlib.blake2b(chunk.content.encode('utf-8'), digest_size=16).digest()
+                for chunk in batch]
+        pending = [(key, chunk) for key, chunk in zip(keys, batch)
+                   if key not in self._cache]
+
+        if pending:
+            cleaned_texts = await self._request_with_retry(
+                client, [chunk.content for _, chunk in pending]
+            )
+            for (key, _), cleaned_text in zip(pending, cleaned_texts):
+                self._cache[key] = cleaned_text
+
+        return [self._cache[key] for key in keys]
+
+    async def _request_with_retry(self,
+                                  client: AsyncFastAPIClient,
+                                  texts: List[str]) -> List[str]:
+        """
+        Send one batch cleaning request with retry logic.
 
         Args:
-            chunk: Chunk to clean
+            client: Shared async API client
+            texts: Texts to clean in one request
 
         Returns:
-            Cleaned text
+            List of cleaned texts
         """
         last_error = None
 
         for attempt in range(self.max_retries + 1):
             try:
                 if attempt > 0:
-                    # Simple delay for retry
-                    delay = attempt * 1.0
-                    logger.debug(f"Retrying after {delay}s...")
-                    time.sleep(delay)
+                    # Exponential backoff with jitter so concurrent workers
+                    # don't retry in lock-step against a struggling server
+                    delay = min(0.5 * 2 ** attempt, 8.0) * random.uniform(0.5, 1.5)
+                    logger.debug(f"Retrying after {delay:.1f}s...")
+                    await asyncio.sleep(delay)
 
                 # Make API call
-                cleaned_text = self.api_client.clean_text(chunk.content)
+                cleaned_texts = await client.clean_texts(texts)
 
-                if not cleaned_text.strip():
+                if not all(text.strip() for text in cleaned_texts):
                     raise APIClientError("API returned empty text")
 
-                return cleaned_text
+                return cleaned_texts
 
             except APIClientError as e:
                 last_error = e
+                if not e.retriable:
+                    # 4xx-style failures won't succeed on retry -
+                    # fall through to the caller's fallback immediately
+                    logger.debug("Non-retriable error, giving up early")
+                    break
                 if attempt < self.max_retries:
                     logger.debug(f"Attempt {attempt + 1} failed, retrying...")
 
@@ -266,17 +440,21 @@ class DocumentCleaner:
         Returns:
             Final aggregated text
         """
-        # Simple aggregation: join with space
-        aggregated = " ".join(chunk.strip() for chunk in cleaned_chunks if chunk.strip())
-
-        # Basic cleanup
-        import re
-        aggregated = re.sub(r' +', ' ', aggregated)  # Multiple spaces -> single
-        aggregated = re.sub(r'\.([A-Z])', r'. \1', aggregated)  # Space after period
-
-        return aggregated.strip()
-
-    def _save_document(self, text: str, output_file: str):
+        # The API client guarantees cleaned text carries no leading or
+        # trailing whitespace (and splitter fallbacks are offset-trimmed),
+        # so chunks only need an emptiness test here - no re-strip scan.
+        # Joining with a single space cannot create multi-space runs or
+        # missing-space seams (".Word") between chunks, so both repairs
+        # run per chunk - space runs collapsed, the space after a
+        # sentence period restored - matching a whole-document pass. A
+        # list (not a generator) lets str.join take its length-known
+        # single-pass path.
+        parts = [_PERIOD_SPACE_RE.sub(r'. \1', _MULTISPACE_RE.sub(' ', chunk))
+                 for chunk in cleaned_chunks if chunk]
+
+        return " ".join(parts).strip()
+
+    async def _save_document(self, text: str, output_file: str):
         """
         Save cleaned text to output file.
 
@@ -287,11 +465,17 @@ class DocumentCleaner:
         try:
             output_path = Path(output_file)
 
-            # Create output directory if needed
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            # Create output directory if needed (once per directory)
+            parent = output_path.parent
+            if parent not in self._ensured_dirs:
+                parent.mkdir(parents=True, exist_ok=True)
+                self._ensured_dirs.add(parent)
 
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(text)
+            # Encode once and write the whole document in a single call -
+            # avoids the TextIOWrapper's chunked encode/flush cycle
+            data = text.encode('utf-8')
+            async with aiofiles.open(output_path, 'wb') as f:
+                await f.write(data)
 
             logger.info(f"Saved cleaned document: {output_path}")
 
@@ -315,10 +499,8 @@ class DocumentCleaner:
         # Generate: original_name_cleaned.txt
         output_filename = f"{stem}_cleaned{suffix}"
 
-        # Create output directory
-        output_dir = Path(Config.DATA_OUTPUT_DIR)
-        output_dir.mkdir(parents=True, exist_ok=True)
-        output_path = output_dir / output_filename
+        # _save_document creates the directory when writing
+        output_path = Path(Config.DATA_OUTPUT_DIR) / output_filename
 
         return str(output_path)
 
@@ -0,0 +1,53 @@
+"""
+Example usage of the TextSplitter.
+
+Lives outside the document_cleaner package so importing the splitter in
+production code never pays for the demo text or its print loop.
+
+Run from the project root:
+    python examples/text_splitter_demo.py
+"""
+
+import logging
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from document_cleaner.text_splitter import TextSplitter
+
+if __name__ == "__main__":
+    # Setup logging for testing
+    logging.basicConfig(level=logging.INFO)
+
+    # Test with sample text
+    sample_text = """
+    This is a test document with multiple paragraphs.
+    It should be split intelligently by the LangChain splitter.
+
+    This is a second paragraph with more content to test
+    the splitting functionality. The algorithm should handle
+    various text structures gracefully.
+
+    Short paragraph.
+
+    This is a longer paragraph that might need to be split
+    if it exceeds the target chunk size. It contains multiple
+    sentences to test sentence boundary preservation.
+    """
+
+    print("Testing TextSplitter...")
+    print(f"Sample text length: {len(sample_text)} characters")
+    print("-" * 50)
+
+    # Create splitter with small chunk size for demo
+    splitter = TextSplitter(chunk_size=200, chunk_overlap=30)
+
+    # Split the text
+    chunks = splitter.split_text(sample_text)
+
+    # Display results
+    for i, chunk in enumerate(chunks, 1):
+        print(f"\nChunk {i}: {chunk}")
+        print(f"Content: {chunk.content[:80]}...")
+
+    print(f"\nTotal chunks created: {len(chunks)}")
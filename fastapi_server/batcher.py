@@ -0,0 +1,118 @@
+"""
+Dynamic micro-batching for concurrent LLM-bound requests.
+
+Coalesces work items arriving within a short window into one batch, so
+N concurrent HTTP requests cost one provider round-trip instead of N.
+The batcher is payload-agnostic: callers submit an item and await its
+result, and a caller-supplied coroutine processes each drained batch.
+"""
+
+import asyncio
+import time
+
+# Setup logging
+import logging
+logger = logging.getLogger(__name__)
+
+
+class DynamicBatcher:
+    """
+    Generic asyncio batcher: collect items briefly, process them together.
+
+    Items submitted while a window is open are drained as one batch once
+    max_batch_size is reached, the accumulated cost exceeds max_cost, or
+    max_delay elapses - whichever comes first. Drained items are grouped
+    by bucket_key (typically an input-length bucket) so one batch never
+    mixes tiny and huge payloads, which keeps per-batch variance low.
+
+    The process coroutine receives a list of (payload, future) pairs and
+    is responsible for resolving every future; exceptions it raises are
+    propagated to any still-pending futures in the batch.
+    """
+
+    def __init__(self, process, max_batch_size=8, max_delay=0.05,
+                 max_cost=None, cost=len, bucket_key=None):
+        self._process = process
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.max_cost = max_cost
+        self._cost = cost
+        self._bucket_key = bucket_key
+        self._queue = asyncio.Queue()
+        self._worker = None
+
+    def start(self):
+        """Launch the serve loop; call from the application's lifespan."""
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._serve_loop())
+
+    async def stop(self):
+        """
+        Cancel the serve loop and fail everything still outstanding.
+
+        Items already collected into a batch are cancelled by the loop
+        itself; items still sitting in the queue are drained and
+        cancelled here, so no submit() caller is left hanging at
+        shutdown.
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.cancel()
+
+    async def submit(self, payload):
+        """Queue one item and wait for its batch to be processed."""
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((payload, future))
+        return await future
+
+    async def _serve_loop(self):
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                budget = self._cost(batch[0][0])
+                deadline = time.monotonic() + self.max_delay
+
+                while len(batch) < self.max_batch_size and (
+                        self.max_cost is None or budget < self.max_cost):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                    batch.append(item)
+                    budget += self._cost(item[0])
+
+                for group in self._bucketed(batch):
+                    try:
+                        await self._process(group)
+                    except Exception as e:
+                        for _, future in group:
+                            if not future.done():
+                                future.set_exception(e)
+            except asyncio.CancelledError:
+                # Shutdown mid-batch: fail the collected items rather
+                # than leaving their submit() callers waiting forever
+                for _, future in batch:
+                    if not future.done():
+                        future.cancel()
+                raise
+
+    def _bucketed(self, batch):
+        """Split a drained batch into groups of similar-cost items."""
+        if self._bucket_key is None or len(batch) == 1:
+            return [batch]
+        groups = {}
+        for item in batch:
+            groups.setdefault(self._bucket_key(item[0]), []).append(item)
+        return list(groups.values())
@@ -6,15 +6,23 @@ Provides two main endpoints:
 2. POST /chat - for sales chat conversation with AI buyer
 """
 
+import asyncio
+import json
+import logging
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse, StreamingResponse
 import uvicorn
-import logging
 
 # Import our modules
 from .llm_service import get_llm_service
 from .models import (
     CleanTextRequest,
     CleanTextResponse,
+    CleanTextBatchRequest,
+    CleanTextBatchResponse,
     ChatRequest,
     ChatResponse,
     ChatMessage
@@ -24,27 +32,67 @@ from .models import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Build and warm the LLM service at startup.
+
+    Construction happens here so no request pays cold init, and a
+    single probe call primes the Azure connection pool (TLS handshake,
+    auth) before traffic arrives - it also pre-fills the cached result
+    the /ready endpoint reads. A warm-up failure is logged, not fatal:
+    the service may come up before Azure is reachable.
+    """
+    llm_service = get_llm_service()
+    llm_service.batching_cleaner.start()
+    if not await llm_service.test_connection():
+        logger.warning("Warm-up probe failed; continuing startup")
+    yield
+    await llm_service.batching_cleaner.stop()
+    await llm_service.aclose()
+
+
 # Create FastAPI application
 app = FastAPI(
     title="Text Cleaning & Sales Chat API",
     description="API for cleaning text artifacts and conducting B2B sales conversations",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    # orjson serializes the long cleaned_text payloads several times
+    # faster than the stdlib encoder
+    default_response_class=ORJSONResponse
 )
 
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint for monitoring."""
+    """
+    Liveness check: is the process up and serving requests.
+
+    Deliberately does not touch Azure - liveness probes fire often and
+    must not spend model calls or wait on upstream round-trips.
+    """
+    return {"status": "healthy"}
+
+
+@app.get("/ready")
+async def readiness_check():
+    """
+    Readiness check: can the service reach Azure OpenAI.
+
+    The underlying probe result is cached for 30 s, so frequent probes
+    cost at most one Azure call per TTL window.
+    """
     try:
         llm_service = get_llm_service()
-        connection_ok = llm_service.test_connection()
+        connection_ok = await llm_service.test_connection()
 
         return {
-            "status": "healthy" if connection_ok else "unhealthy",
+            "status": "ready" if connection_ok else "not ready",
             "llm_service": "connected" if connection_ok else "disconnected"
         }
     except Exception as e:
-        logger.error(f"Health check failed: {str(e)}")
+        logger.error("Readiness check failed: %s", e)
         raise HTTPException(status_code=503, detail=f"Service unavailable: {str(e)}")
 
 
@@ -56,19 +104,42 @@ async def clean_text(request: CleanTextRequest):
     Perfect for processing extracted PDF content.
     """
     try:
-        logger.info(f"Cleaning text: {len(request.text)} characters")
+        logger.info("Cleaning text: %d characters", len(request.text))
 
         llm_service = get_llm_service()
-        cleaned_text = llm_service.clean_text(request.text)
+        cleaned_text = await llm_service.batching_cleaner.clean_text(request.text)
 
-        logger.info(f"Text cleaned: {len(cleaned_text)} characters")
+        logger.info("Text cleaned: %d characters", len(cleaned_text))
         return CleanTextResponse(cleaned_text=cleaned_text)
 
     except Exception as e:
-        logger.error(f"Text cleaning failed: {str(e)}")
+        logger.error("Text cleaning failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Text cleaning failed: {str(e)}")
 
 
+@app.post("/clean-batch", response_model=CleanTextBatchResponse)
+async def clean_text_batch(request: CleanTextBatchRequest):
+    """
+    Clean several texts in one request.
+
+    Lets clients amortize HTTP overhead when processing many chunks.
+    """
+    try:
+        logger.info("Cleaning batch: %d texts", len(request.texts))
+
+        llm_service = get_llm_service()
+        cleaned_texts = list(await asyncio.gather(
+            *(llm_service.batching_cleaner.clean_text(text)
+              for text in request.texts)
+        ))
+
+        return CleanTextBatchResponse(cleaned_texts=cleaned_texts)
+
+    except Exception as e:
+        logger.error("Batch text cleaning failed: %s", e)
+        raise HTTPException(status_code=500, detail=f"Batch text cleaning failed: {str(e)}")
+
+
 @app.post("/chat", response_model=ChatResponse)
 async def chat_conversation(request: ChatRequest):
     """
@@ -77,41 +148,65 @@ async def chat_conversation(request: ChatRequest):
     The AI acts as a skeptical B2B buyer who requires convincing arguments.
     """
     try:
-        logger.info(f"Chat request: {len(request.message)} chars, {len(request.chat_history)} history")
+        logger.info("Chat request: %d chars, %d history", len(request.message), len(request.chat_history))
 
         llm_service = get_llm_service()
 
-        # Convert to dict format for LLM service
-        chat_history_dict = []
-        for msg in request.chat_history:
-            chat_history_dict.append({
-                "role": msg.role,
-                "content": msg.content
-            })
-
-        # Generate AI response
-        ai_response = llm_service.chat_completion(
+        # Generate AI response; the service reads ChatMessage objects
+        # directly, so no per-turn dict conversion of the history
+        ai_response = await llm_service.chat_completion(
             message=request.message,
-            chat_history=chat_history_dict
+            chat_history=request.chat_history
+        )
+
+        # Return only this turn's delta; the client appends it locally,
+        # so the payload stays constant-size as the conversation grows.
+        # model_construct skips re-validation - both fields were already
+        # validated on the way in or produced by us
+        new_messages = [
+            ChatMessage.model_construct(role="user", content=request.message),
+            ChatMessage.model_construct(role="assistant", content=ai_response)
+        ]
+
+        logger.info("Chat response generated: %d chars", len(ai_response))
+        return ChatResponse(
+            response=ai_response,
+            new_messages=new_messages,
+            turn_id=len(request.chat_history) // 2 + 1
         )
 
-        # Build updated history
-        updated_history = []
+    except Exception as e:
+        logger.error("Chat generation failed: %s", e)
+        raise HTTPException(status_code=500, detail=f"Chat generation failed: {str(e)}")
 
-        # Add previous history
-        for msg in request.chat_history:
-            updated_history.append(msg)
 
-        # Add new messages
-        updated_history.append(ChatMessage(role="user", content=request.message))
-        updated_history.append(ChatMessage(role="assistant", content=ai_response))
+@app.post("/chat/stream")
+async def chat_conversation_stream(request: ChatRequest):
+    """
+    B2B sales conversation with AI buyer, streamed as Server-Sent Events.
 
-        logger.info(f"Chat response generated: {len(ai_response)} chars")
-        return ChatResponse(response=ai_response, updated_history=updated_history)
+    Tokens are forwarded as they arrive from the model, so clients see
+    the first words in well under a second instead of waiting for the
+    complete reply. Each event carries a JSON object with a "token"
+    field; the stream ends with a literal [DONE] event.
+    """
+    logger.info("Chat stream request: %d chars, %d history", len(request.message), len(request.chat_history))
 
-    except Exception as e:
-        logger.error(f"Chat generation failed: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Chat generation failed: {str(e)}")
+    llm_service = get_llm_service()
+
+    async def event_stream():
+        try:
+            async for token in llm_service.chat_completion_stream(
+                    message=request.message,
+                    chat_history=request.chat_history):
+                yield f"data: {json.dumps({'token': token})}\n\n"
+            yield "data: [DONE]\n\n"
+        except Exception as e:
+            # The status line is already sent; report errors in-band
+            logger.error("Chat streaming failed: %s", e)
+            yield f"data: {json.dumps({'error': str(e)})}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
 
 
 if __name__ == "__main__":
@@ -122,9 +217,23 @@ if __name__ == "__main__":
     print("   - POST http://localhost:8000/chat")
     print("   - GET http://localhost:8000/health")
 
-    uvicorn.run(
-        "fastapi_server.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True
-    )
+    if os.getenv("DEV") == "1":
+        # Auto-reload for local development; incompatible with workers
+        uvicorn.run(
+            "fastapi_server.main:app",
+            host="0.0.0.0",
+            port=8000,
+            reload=True
+        )
+    else:
+        # uvloop + httptools cut per-request dispatch overhead, and
+        # multiple workers spread pydantic/JSON work across cores; the
+        # lifespan hook builds one LLM service per worker process
+        uvicorn.run(
+            "fastapi_server.main:app",
+            host="0.0.0.0",
+            port=8000,
+            loop="uvloop",
+            http="httptools",
+            workers=int(os.getenv("WORKERS", "4"))
+        )
@@ -5,7 +5,7 @@ Data models for text cleaning and chat functionality.
 """
 
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 
 # Text cleaning models
@@ -19,10 +19,22 @@ class CleanTextResponse(BaseModel):
     cleaned_text: str
 
 
+class CleanTextBatchRequest(BaseModel):
+    """Request model for batched text cleaning endpoint."""
+    texts: List[str]
+
+
+class CleanTextBatchResponse(BaseModel):
+    """Response model for batched text cleaning endpoint."""
+    cleaned_texts: List[str]
+
+
 # Chat models
 class ChatMessage(BaseModel):
     """Single chat message model."""
-    role: str  # "user" or "assistant"
+    # Literal compiles to a set-membership check in pydantic-core,
+    # cheaper than a regex validator and run once per history entry
+    role: Literal["user", "assistant"]
     content: str
 
 
@@ -33,6 +45,13 @@ class ChatRequest(BaseModel):
 
 
 class ChatResponse(BaseModel):
-    """Response model for chat endpoint."""
+    """
+    Response model for chat endpoint.
+
+    Carries only the two messages added this turn; the client appends
+    them to its local history, keeping the payload constant-size instead
+    of echoing the whole conversation back every call.
+    """
     response: str
-    updated_history: List[ChatMessage]
+    new_messages: List[ChatMessage]
+    turn_id: int
@@ -6,7 +6,7 @@ The AI acts as a skeptical B2B buyer who requires convincing arguments.
 """
 
 import sys
-import requests
+import httpx
 import json
 import os
 from typing import List, Dict
@@ -14,6 +14,7 @@ from typing import List, Dict
 # Import config for API URL
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from shared.config import Config
+from shared.history import compact_history
 
 
 class SalesChatApp:
@@ -25,7 +26,13 @@ class SalesChatApp:
 
     def __init__(self):
         """Initialize the sales chat application."""
-        self.api_url = f"{Config.FASTAPI_BASE_URL}/chat"
+        # One pooled client for the whole session: every turn reuses the
+        # kept-alive connection instead of a fresh TCP+TLS handshake
+        self.client = httpx.Client(
+            base_url=Config.FASTAPI_BASE_URL,
+            timeout=30,
+            limits=httpx.Limits(max_keepalive_connections=4)
+        )
         self.chat_history = []
         print("B2B Sales Chat Application")
         print("=" * 50)
@@ -36,9 +43,8 @@ class SalesChatApp:
 
     def start_conversation(self):
         """Start the sales conversation with buyer greeting."""
-        # Buyer starts with greeting
+        # Buyer starts with greeting, streamed to the console
         buyer_greeting = self._get_ai_response("Hello, I'm here to learn about your offering.")
-        self._display_message("BUYER", buyer_greeting)
 
         # Add to history
         self.chat_history.extend([
@@ -67,9 +73,8 @@ class SalesChatApp:
                     print("Please enter a message or 'Bye' to exit.")
                     continue
 
-                # Get AI response
+                # Get AI response, streamed to the console as it arrives
                 ai_response = self._get_ai_response(user_input)
-                self._display_message("BUYER", ai_response)
 
                 # Update history
                 self.chat_history.extend([
@@ -86,26 +91,38 @@ class SalesChatApp:
                 return
 
     def _get_ai_response(self, message: str) -> str:
-        """Get AI response from FastAPI server."""
+        """
+        Get AI response from the streaming chat endpoint.
+
+        Tokens are printed as they arrive, so the buyer appears to type
+        in real time instead of leaving dead air while the full reply
+        generates. Returns the complete reply for the history.
+        """
+        # Compacting here bounds the request payload; the server applies
+        # its own summarizing window on top for the prompt itself
         payload = {
             "message": message,
-            "chat_history": self.chat_history
+            "chat_history": compact_history(self.chat_history)
         }
 
-        response = requests.post(
-            self.api_url,
-            json=payload,
-            headers={"Content-Type": "application/json"},
-            timeout=30
-        )
-
-        response.raise_for_status()
-        result = response.json()
-        return result["response"]
-
-    def _display_message(self, sender: str, message: str):
-        """Display a chat message with nice formatting."""
-        print(f"\n{sender}: {message}")
+        parts = []
+        print("\nBUYER: ", end="", flush=True)
+        with self.client.stream("POST", "/chat/stream", json=payload) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line.startswith("data: "):
+                    continue
+                data = line[len("data: "):]
+                if data == "[DONE]":
+                    break
+                event = json.loads(data)
+                if "error" in event:
+                    raise RuntimeError(event["error"])
+                token = event.get("token", "")
+                print(token, end="", flush=True)
+                parts.append(token)
+        print()
+        return "".join(parts)
 
 
 def main():
@@ -113,19 +130,19 @@ def main():
     try:
         # Check if FastAPI server is running
         health_url = f"{Config.FASTAPI_BASE_URL}/health"
-        health_response = requests.get(health_url, timeout=5)
+        health_response = httpx.get(health_url, timeout=5)
         health_response.raise_for_status()
 
         # Start the chat application
         app = SalesChatApp()
         app.start_conversation()
 
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         print("Error: Cannot connect to FastAPI server.")
         print("Please start the server first:")
         print("   python -m fastapi_server.main")
 
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"Error: API request failed - {e}")
 
     except KeyboardInterrupt:
@@ -16,7 +16,9 @@ class Config:
     """
 
     # FastAPI Server Configuration
-    FASTAPI_BASE_URL = os.getenv("FASTAPI_URL", "http://localhost:8000")
+    # Trailing slash stripped so every derived URL and cache key is
+    # canonical regardless of how the env var was written
+    FASTAPI_BASE_URL = os.getenv("FASTAPI_URL", "http://localhost:8000").rstrip("/")
 
     # Text Processing Configuration
     # Chunk size optimized based on GPT-4o cleaning prompt performance testing:
@@ -31,6 +33,7 @@ class Config:
     # Network Configuration
     REQUEST_TIMEOUT = 30
     MAX_RETRIES = 3
+    MAX_CONCURRENT_REQUESTS = 8
 
     # File Paths Configuration
     DATA_INPUT_DIR = "data/input"
@@ -42,3 +45,29 @@ class Config:
 def get_config() -> Config:
     """Get the configuration class."""
     return Config
+
+
+def _validate() -> None:
+    """
+    Sanity-check the configuration at import time.
+
+    A bad FASTAPI_URL or nonsense numeric setting should fail here with
+    a clear message, not surface later as a confusing connection error
+    deep inside the first request.
+    """
+    if not Config.FASTAPI_BASE_URL.startswith(("http://", "https://")):
+        raise ValueError(
+            f"FASTAPI_URL must start with http:// or https://, "
+            f"got: {Config.FASTAPI_BASE_URL!r}"
+        )
+    if not (Config.MIN_CHUNK_SIZE
+            <= Config.DEFAULT_CHUNK_SIZE
+            <= Config.MAX_CHUNK_SIZE):
+        raise ValueError("Chunk size settings are inconsistent")
+    if Config.REQUEST_TIMEOUT <= 0 or Config.MAX_RETRIES < 1:
+        raise ValueError("Network settings must be positive")
+    if Config.MAX_CONCURRENT_REQUESTS < 1:
+        raise ValueError("MAX_CONCURRENT_REQUESTS must be at least 1")
+
+
+_validate()
@@ -0,0 +1,43 @@
+"""
+Chat history compaction helpers.
+
+Bounds the number of messages sent per chat turn so late-session
+payloads and token costs stay constant instead of growing with the
+conversation. Shared between the console chat client and any other
+caller that accumulates history locally.
+"""
+
+from typing import Dict, List
+
+# How many messages a request may carry before compaction kicks in
+MAX_HISTORY_MESSAGES = 20
+
+# Opening messages kept verbatim - the conversation's framing (what is
+# being sold, who the parties are) usually lives in the first turns
+ANCHOR_MESSAGES = 4
+
+
+def compact_history(history: List[Dict[str, str]],
+                    max_messages: int = MAX_HISTORY_MESSAGES,
+                    anchor: int = ANCHOR_MESSAGES) -> List[Dict[str, str]]:
+    """
+    Bound a chat history to a sliding window with an opening anchor.
+
+    Histories at or under max_messages pass through untouched. Longer
+    ones keep the first `anchor` messages plus the most recent tail,
+    dropping the middle. The anchor stays byte-identical across turns,
+    so the compacted prefix remains friendly to provider prompt caches.
+
+    Args:
+        history (List[Dict]): Full conversation, oldest first
+        max_messages (int): Size cap for the returned list
+        anchor (int): Opening messages always kept verbatim
+
+    Returns:
+        List[Dict]: The original list, or a compacted copy
+    """
+    if len(history) <= max_messages:
+        return history
+
+    tail = max_messages - anchor
+    return history[:anchor] + history[-tail:]
@@ -0,0 +1,45 @@
+"""
+Regression tests for the boundary-scan text splitter.
+"""
+
+from document_cleaner.text_splitter import TextSplitter
+
+
+def _make_document(paragraphs: int = 4, sentences: int = 24) -> str:
+    """Build a multi-paragraph document of realistic sentence lengths."""
+    parts = []
+    for p in range(paragraphs):
+        parts.append(" ".join(
+            f"Paragraph {p} sentence {s} with a little padding text "
+            f"to reach realistic length." for s in range(sentences)
+        ))
+    return "\n\n".join(parts)
+
+
+def test_overlap_split_makes_forward_progress():
+    """
+    With chunk_overlap > 0 each cut must land strictly past the
+    previous one. A regression here re-selects the same boundary after
+    the cursor steps back by the overlap, emitting hundreds of
+    degenerate chunks that shrink one character at a time.
+    """
+    text = _make_document()
+    splitter = TextSplitter(chunk_size=1500, chunk_overlap=150)
+    chunks = splitter.split_text(text, cache=False)
+
+    # ~7.4 KB at chunk_size 1500 should land in single digits; the
+    # regression produced 452 chunks for this document
+    assert len(chunks) <= 10
+
+    # Total output may exceed the input only by roughly the overlap
+    # carried on each chunk, never by multiples of the document
+    total = sum(chunk.char_count for chunk in chunks)
+    assert total <= len(text) + len(chunks) * splitter.chunk_overlap
+
+    # Strictly increasing cut points: every chunk advances
+    ends = [chunk.end for chunk in chunks]
+    assert all(later > earlier for earlier, later in zip(ends, ends[1:]))
+
+    # The split still covers the document end to end
+    assert chunks[0].start <= 1
+    assert chunks[-1].end >= len(text.rstrip())